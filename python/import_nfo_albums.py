@@ -13,14 +13,30 @@ Prerequisites:
 
 Requires: requests
 Install: pip install requests
+Optional: orjson (faster decoding of large album lists; pip install orjson)
 """
 
+import itertools
+import json
+import multiprocessing
 import os
+import queue
 import re
+import string
+import sys
+import threading
 import xml.etree.ElementTree as ET
-from typing import List, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Configuration
 LIDARR_URL = "http://localhost:8686"  # Your Lidarr URL
@@ -29,30 +45,78 @@ MUSIC_FOLDER_PATH = "/path/to/music"  # Root folder containing album.nfo files
 QUALITY_PROFILE_ID = 1  # Quality profile ID in Lidarr
 METADATA_PROFILE_ID = 1  # Metadata profile ID in Lidarr
 ROOT_FOLDER_PATH = "/music"  # Root folder path in Lidarr
+MAX_WORKERS = 8  # Albums processed concurrently (keep low to avoid overloading Lidarr)
+NFO_QUEUE_SIZE = 1024  # Parsed NFO files buffered ahead of the workers
+PARSE_BATCH_SIZE = 1024  # NFO files handed to the parser processes at a time
+ALBUM_CACHE_PATH = os.path.expanduser("~/.cache/lidarr_albums.json")  # Cached Lidarr album IDs
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+# Matches either MusicBrainz ID tag in a single pass over malformed NFO content
+_MBID_RE = re.compile(
+    r'<musicbrainz(releasegroupid|albumid)>\s*'
+    r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})'
+    r'\s*</musicbrainz\1>',
+    re.IGNORECASE
+)
+
+# Guards inserts into the shared set of existing album IDs
+_existing_lock = threading.Lock()
+
+# Guards the set of MusicBrainz IDs already handled during this run
+_seen_lock = threading.Lock()
+
+# Keeps each album's log lines together when workers print at the same time
+_print_lock = threading.Lock()
 
 
-def find_nfo_files(root_path: str) -> List[str]:
+def find_nfo_files(root_path: str) -> Iterator[str]:
     """Find all album.nfo files in the directory tree.
     
+    Uses os.scandir directly so the file type cached on each directory entry
+    is reused instead of issuing an extra stat call per entry.
+    
     Args:
         root_path: Root directory to search for NFO files.
         
+    Yields:
+        Paths to album.nfo files found.
+    """
+    try:
+        entries = os.scandir(root_path)
+    except OSError as e:
+        print(f"Error scanning {root_path}: {e}")
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_nfo_files(entry.path)
+            elif entry.name.lower() == "album.nfo":
+                yield entry.path
+
+def is_valid_mbid(value: str) -> bool:
+    """Check that a string looks like a MusicBrainz ID (a hyphenated UUID).
+    
+    Args:
+        value: Candidate ID text.
+        
     Returns:
-        List of absolute paths to album.nfo files found.
+        True if the value is 36 characters of hex digits with hyphens in the
+        UUID positions, False otherwise.
     """
-    nfo_files = []
-    for root, dirs, files in os.walk(root_path):
-        for file in files:
-            if file.lower() == "album.nfo":
-                nfo_files.append(os.path.join(root, file))
-    return nfo_files
+    if len(value) != 36 or value[8] != '-' or value[13] != '-' or value[18] != '-' or value[23] != '-':
+        return False
+    digits = value.replace('-', '')
+    return len(digits) == 32 and _HEX_DIGITS.issuperset(digits)
 
 def extract_musicbrainz_id(nfo_path: str) -> Optional[str]:
     """Extract MusicBrainz release group ID from NFO file.
     
     Attempts to parse the NFO file as XML (Kodi format) first, looking for
-    musicbrainzreleasegroupid or musicbrainzalbumid tags. Falls back to
-    regex pattern matching if XML parsing fails.
+    musicbrainzreleasegroupid or musicbrainzalbumid tags. The file is parsed
+    incrementally and parsing stops as soon as a release group ID is seen.
+    Falls back to regex pattern matching if XML parsing fails.
     
     Args:
         nfo_path: Path to the album.nfo file.
@@ -62,61 +126,168 @@ def extract_musicbrainz_id(nfo_path: str) -> Optional[str]:
     """
     try:
         # Try parsing as XML first (Kodi format)
-        tree = ET.parse(nfo_path)
-        root = tree.getroot()
-        
-        # Look for musicbrainzreleasegroupid tag
-        mb_id = root.find('.//musicbrainzreleasegroupid')
-        if mb_id is not None and mb_id.text:
-            return mb_id.text.strip()
+        album_id = None
+        for _, elem in ET.iterparse(nfo_path, events=('end',)):
+            if elem.tag in ('musicbrainzreleasegroupid', 'musicbrainzalbumid') and elem.text:
+                mb_id = elem.text.strip()
+                if is_valid_mbid(mb_id):
+                    # Look for musicbrainzreleasegroupid tag
+                    if elem.tag == 'musicbrainzreleasegroupid':
+                        return mb_id
+                    
+                    # Remember musicbrainzalbumid as fallback
+                    if album_id is None:
+                        album_id = mb_id
+            
+            elem.clear()
         
-        # Also check for musicbrainzalbumid as fallback
-        mb_id = root.find('.//musicbrainzalbumid')
-        if mb_id is not None and mb_id.text:
-            return mb_id.text.strip()
+        if album_id:
+            return album_id
             
     except ET.ParseError:
         # If XML parsing fails, try regex search
         try:
             with open(nfo_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                # Look for UUID format
-                match = re.search(r'<musicbrainzreleasegroupid>([a-f0-9-]{36})</musicbrainzreleasegroupid>', content, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-                match = re.search(r'<musicbrainzalbumid>([a-f0-9-]{36})</musicbrainzalbumid>', content, re.IGNORECASE)
-                if match:
-                    return match.group(1)
+                # Cheap substring check before running the regex
+                if '<musicbrainz' not in content.lower():
+                    return None
+                
+                # Look for UUID format, preferring the release group ID
+                album_id = None
+                for match in _MBID_RE.finditer(content):
+                    if match.group(1).lower() == 'releasegroupid':
+                        return match.group(2)
+                    if album_id is None:
+                        album_id = match.group(2)
+                if album_id:
+                    return album_id
         except Exception as e:
             print(f"Error reading {nfo_path}: {e}")
+    except OSError as e:
+        print(f"Error reading {nfo_path}: {e}")
     
     return None
 
-def check_album_exists(mb_id: str) -> bool:
-    """Check if album already exists in Lidarr.
+def create_session() -> requests.Session:
+    """Create an HTTP session for Lidarr requests.
+    
+    The session keeps connections alive between requests, with a connection
+    pool large enough for every worker thread, and sends the API key on
+    every request.
+    
+    Returns:
+        Configured requests session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"X-Api-Key": LIDARR_API_KEY})
+    return session
+
+def load_album_cache() -> Optional[Dict]:
+    """Load the cached Lidarr album IDs written by a previous run.
+    
+    Returns:
+        Dictionary with the "etag" and "ids" of the cached album list, or None
+        if there is no usable cache for the configured Lidarr URL.
+    """
+    try:
+        with open(ALBUM_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cache.get('url') != LIDARR_URL or not cache.get('etag'):
+        return None
+    return cache
+
+def save_album_cache(etag: str, ids: Set[str]) -> None:
+    """Save Lidarr album IDs together with the ETag they were served with.
     
     Args:
-        mb_id: MusicBrainz release group ID to check.
+        etag: ETag header of the /api/v1/album response.
+        ids: Album IDs from that response.
+    """
+    try:
+        os.makedirs(os.path.dirname(ALBUM_CACHE_PATH), exist_ok=True)
+        with open(ALBUM_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'url': LIDARR_URL, 'etag': etag, 'ids': sorted(ids)}, f)
+    except OSError as e:
+        print(f"Warning: could not write album cache {ALBUM_CACHE_PATH}: {e}")
+
+def get_existing_album_ids(session: requests.Session) -> Set[str]:
+    """Fetch the MusicBrainz IDs of every album already in Lidarr.
+    
+    The full album list is requested once up front so that each NFO can be
+    checked against an in-memory set instead of re-downloading the library.
+    When Lidarr sends an ETag, the IDs are cached on disk and the next run
+    revalidates them with If-None-Match, so an unchanged library is answered
+    with an empty 304 response.
+    
+    Args:
+        session: HTTP session used for Lidarr requests.
         
     Returns:
-        True if album exists in Lidarr, False otherwise.
+        Set of foreignAlbumId values known to Lidarr. Empty if the request fails.
     """
     url = f"{LIDARR_URL}/api/v1/album"
-    headers = {"X-Api-Key": LIDARR_API_KEY}
+    cache = load_album_cache()
+    headers = {"If-None-Match": cache['etag']} if cache else {}
     
     try:
-        response = requests.get(url, headers=headers)
+        response = session.get(url, headers=headers)
+        if response.status_code == 304 and cache:
+            return set(cache['ids'])
         if response.status_code == 200:
-            albums = response.json()
-            for album in albums:
-                if album.get('foreignAlbumId') == mb_id:
-                    return True
+            ids = {album['foreignAlbumId'] for album in json_loads(response.content) if album.get('foreignAlbumId')}
+            etag = response.headers.get('ETag')
+            if etag:
+                save_album_cache(etag, ids)
+            return ids
+        print(f"Failed to fetch existing albums: {response.status_code}")
     except Exception as e:
-        print(f"  Error checking if album exists: {e}")
+        print(f"Error fetching existing albums: {e}")
+    
+    return set()
+
+def check_album_exists(mb_id: str, existing: Set[str]) -> bool:
+    """Check if album already exists in Lidarr.
     
-    return False
+    Args:
+        mb_id: MusicBrainz release group ID to check.
+        existing: Set of album IDs already in Lidarr, from get_existing_album_ids().
+        
+    Returns:
+        True if album exists in Lidarr, False otherwise.
+    """
+    return mb_id in existing
 
-def add_album_to_lidarr(mb_id: str, artist_mb_id: Optional[str] = None) -> Optional[bool]:
+def search_album(session: requests.Session, mb_id: str) -> List[Dict]:
+    """Search Lidarr for an album by MusicBrainz ID.
+    
+    Not cached: process_nfo() drops repeated IDs before they get here, so
+    each MBID is only searched once per run.
+    
+    Args:
+        session: HTTP session used for Lidarr requests.
+        mb_id: MusicBrainz release group ID.
+        
+    Returns:
+        List of search results from Lidarr.
+        
+    Raises:
+        requests.HTTPError: If Lidarr returns an error status.
+    """
+    # Use lidarr: prefix for MusicBrainz ID search
+    response = session.get(f"{LIDARR_URL}/api/v1/search", params={"term": f"lidarr:{mb_id}"})
+    response.raise_for_status()
+    return json_loads(response.content)
+
+def add_album_to_lidarr(mb_id: str, existing: Set[str], session: requests.Session,
+                        artist_mb_id: Optional[str] = None,
+                        log: Callable[[str], None] = print) -> Optional[bool]:
     """Add album to Lidarr using MusicBrainz release group ID.
     
     Searches for the album in Lidarr's database and adds it with the configured
@@ -125,172 +296,265 @@ def add_album_to_lidarr(mb_id: str, artist_mb_id: Optional[str] = None) -> Optio
     
     Args:
         mb_id: MusicBrainz release group ID.
+        existing: Set of album IDs already in Lidarr. Updated when an album is added.
+        session: HTTP session used for Lidarr requests.
         artist_mb_id: Optional MusicBrainz artist ID (currently unused).
+        log: Called with each progress line, print by default.
         
     Returns:
         True if album was successfully added.
         False if adding failed.
         None if album already exists in Lidarr.
     """
-    # Check if album already exists
-    if check_album_exists(mb_id):
-        print(f"  ⊘ Album already exists in Lidarr, skipping")
+    # Check if album already exists before the search request
+    if check_album_exists(mb_id, existing):
+        log(f"  ⊘ Album already exists in Lidarr, skipping")
         return None  # Return None to indicate "already exists"
     
     url = f"{LIDARR_URL}/api/v1/album"
-    headers = {
-        "X-Api-Key": LIDARR_API_KEY,
-        "Content-Type": "application/json"
-    }
-    
-    # Search for the album first (using lidarr: prefix for MusicBrainz ID search)
-    search_url = f"{LIDARR_URL}/api/v1/search"
-    params = {"term": f"lidarr:{mb_id}"}
     
     try:
-        response = requests.get(search_url, headers=headers, params=params)
-        if response.status_code != 200:
-            print(f"Failed to search for album {mb_id}")
+        # Search for the album first
+        try:
+            results = search_album(session, mb_id)
+        except requests.HTTPError:
+            log(f"Failed to search for album {mb_id}")
             return False
         
-        results = response.json()
         if not results:
-            print(f"✗ No results found for {mb_id}")
+            log(f"✗ No results found for {mb_id}")
             return False
         
         # Debug: Print what we got back
-        print(f"  Found {len(results)} search result(s)")
+        log(f"  Found {len(results)} search result(s)")
         
         # Find the album in search results - handle different response structures
         album_data = None
         artist_data = None
         
-        for i, result in enumerate(results):
+        for result in results:
             # Lidarr search can return: album objects directly, or nested in 'album' key
-            if result.get('album'):
-                current_album = result['album']
-                current_artist = result.get('artist')
-            else:
-                current_album = result
-                current_artist = result.get('artist')
+            current_album = result.get('album') or result
             
             # Check if this is our album
             foreign_id = current_album.get('foreignAlbumId', '')
             if foreign_id == mb_id or foreign_id.endswith(mb_id):
                 album_data = current_album
-                artist_data = current_artist
-                print(f"  Matched album: {current_album.get('title', 'Unknown')}")
+                # The artist sits next to a nested album, or inside a direct one
+                artist_data = result.get('artist') or current_album.get('artist')
                 break
         
         if not album_data:
-            print(f"✗ Album {mb_id} not found in search results")
-            print(f"  Available IDs in results:")
+            log(f"✗ Album {mb_id} not found in search results")
+            log(f"  Available IDs in results:")
             for result in results[:3]:  # Show first 3
                 album = result.get('album', result)
                 fid = album.get('foreignAlbumId', 'N/A')
                 title = album.get('title', 'N/A')
-                print(f"    - {fid}: {title}")
+                log(f"    - {fid}: {title}")
             return False
         
-        # Get artist information
-        artist_data = album_data.get('artist')
+        album_title = album_data.get('title', mb_id)
+        log(f"  Matched album: {album_title}")
+        
         if not artist_data:
-            print(f"✗ No artist data found for album {mb_id}")
+            log(f"✗ No artist data found for album {mb_id}")
             return False
         
-        # Ensure artist has required fields
-        if not artist_data.get('qualityProfileId'):
-            artist_data['qualityProfileId'] = QUALITY_PROFILE_ID
-        if not artist_data.get('metadataProfileId'):
-            artist_data['metadataProfileId'] = METADATA_PROFILE_ID
-        if not artist_data.get('rootFolderPath'):
-            artist_data['rootFolderPath'] = ROOT_FOLDER_PATH
-        if not artist_data.get('monitored'):
-            artist_data['monitored'] = True
-        
-        # Prepare the payload - include all necessary fields from search result
+        # Prepare a minimal payload - Lidarr fills in the remaining album and
+        # artist details from its metadata server using the foreign IDs
+        artist_name = artist_data.get('artistName')
         payload = {
-            "title": album_data.get('title'),
             "foreignAlbumId": mb_id,
             "monitored": True,
             "anyReleaseOk": True,
-            "profileId": QUALITY_PROFILE_ID,
-            "duration": album_data.get('duration', 0),
-            "albumType": album_data.get('albumType', ''),
-            "secondaryTypes": album_data.get('secondaryTypes', []),
-            "mediumCount": album_data.get('mediumCount', 0),
-            "ratings": album_data.get('ratings', {'votes': 0, 'value': 0.0}),
-            "releaseDate": album_data.get('releaseDate'),
-            "releases": album_data.get('releases', []),
-            "genres": album_data.get('genres', []),
-            "media": album_data.get('media', []),
-            "artist": artist_data,
-            "images": album_data.get('images', []),
-            "links": album_data.get('links', []),
+            "artist": {
+                "foreignArtistId": artist_data.get('foreignArtistId'),
+                "artistName": artist_name,
+                "qualityProfileId": artist_data.get('qualityProfileId') or QUALITY_PROFILE_ID,
+                "metadataProfileId": artist_data.get('metadataProfileId') or METADATA_PROFILE_ID,
+                "rootFolderPath": artist_data.get('rootFolderPath') or ROOT_FOLDER_PATH,
+                "monitored": True
+            },
             "addOptions": {
                 "searchForNewAlbum": False
             }
         }
         
         # Add the album
-        response = requests.post(url, headers=headers, json=payload)
+        response = session.post(url, json=payload)
         if response.status_code in [200, 201]:
-            album_title = album_data.get('title', mb_id)
-            artist_name = artist_data.get('artistName', 'Unknown Artist')
-            print(f"✓ Successfully added: {artist_name} - {album_title}")
+            with _existing_lock:
+                existing.add(mb_id)
+            log(f"✓ Successfully added: {artist_name or 'Unknown Artist'} - {album_title}")
             return True
         else:
-            print(f"✗ Failed to add album {mb_id}: {response.status_code} - {response.text}")
+            log(f"✗ Failed to add album {mb_id}: {response.status_code} - {response.text}")
             return False
             
     except Exception as e:
-        print(f"Error adding album {mb_id}: {e}")
+        log(f"Error adding album {mb_id}: {e}")
         return False
 
+def process_nfo(nfo_path: str, mb_id: Optional[str], session: requests.Session,
+                existing: Set[str], seen: Set[str]) -> str:
+    """Add the album from one NFO file to Lidarr.
+    
+    Args:
+        nfo_path: Path to the album.nfo file.
+        mb_id: MusicBrainz ID extracted from the file, or None if not found.
+        session: HTTP session used for Lidarr requests.
+        existing: Set of album IDs already in Lidarr.
+        seen: Set of album IDs already handled during this run, shared between
+            workers so that an ID found in several NFO files is only sent once.
+        
+    Returns:
+        One of "added", "already_exists", "failed", "skipped" or "duplicate",
+        for the summary.
+    """
+    # Print the album's lines as one block once it is done, so they are not
+    # interleaved with the other workers' output
+    lines = [f"Processing: {nfo_path}"]
+    try:
+        return _process_nfo(nfo_path, mb_id, session, existing, seen, lines.append)
+    finally:
+        with _print_lock:
+            print("\n".join(lines) + "\n")
+
+def _process_nfo(nfo_path: str, mb_id: Optional[str], session: requests.Session,
+                 existing: Set[str], seen: Set[str], log: Callable[[str], None]) -> str:
+    """Add the album from one NFO file to Lidarr, logging through log."""
+    if not mb_id:
+        log(f"  ✗ No MusicBrainz ID found in {nfo_path}")
+        return "skipped"
+    
+    log(f"  Found ID: {mb_id}")
+    
+    # Multi-disc folders often repeat the same ID in each disc's NFO
+    with _seen_lock:
+        duplicate = mb_id in seen
+        seen.add(mb_id)
+    if duplicate:
+        log(f"  ⊘ Album {mb_id} already handled in this run, skipping")
+        return "duplicate"
+    
+    # Skip known albums without entering add_album_to_lidarr at all
+    if check_album_exists(mb_id, existing):
+        log(f"  ⊘ Album already exists in Lidarr, skipping")
+        return "already_exists"
+    
+    result = add_album_to_lidarr(mb_id, existing, session, log=log)
+    if result is True:
+        return "added"
+    elif result is None:
+        return "already_exists"
+    return "failed"
+
+def queue_nfo_files(root_path: str, nfo_queue: queue.Queue, workers: int,
+                    pool: ProcessPoolExecutor, errors: List[Exception]) -> None:
+    """Feed parsed album.nfo files into a queue as they are discovered.
+    
+    Runs in its own thread so that scanning the music folder overlaps with
+    the Lidarr requests made by the workers. Discovered files are parsed in
+    batches by a pool of processes, so XML parsing uses every CPU core
+    instead of competing with the workers for the GIL. Each queued item is
+    a (path, MusicBrainz ID) tuple, and one None sentinel is queued per
+    worker once scanning finishes or fails.
+    
+    Args:
+        root_path: Root directory to search for NFO files.
+        nfo_queue: Queue shared with the worker threads.
+        workers: Number of worker threads consuming the queue.
+        pool: Process pool used to parse the NFO files.
+        errors: List the exception is appended to if scanning fails, so that
+            main() can tell a partial run from a complete one.
+    """
+    try:
+        nfo_files = find_nfo_files(root_path)
+        while True:
+            batch = list(itertools.islice(nfo_files, PARSE_BATCH_SIZE))
+            if not batch:
+                break
+            mb_ids = pool.map(extract_musicbrainz_id, batch, chunksize=64)
+            for item in zip(batch, mb_ids):
+                nfo_queue.put(item)
+    except Exception as e:
+        print(f"Error scanning for album.nfo files: {e}")
+        errors.append(e)
+    finally:
+        for _ in range(workers):
+            nfo_queue.put(None)
+
+def process_queued_nfo_files(nfo_queue: queue.Queue, session: requests.Session,
+                             existing: Set[str], seen: Set[str]) -> Counter:
+    """Process parsed NFO files from a queue until a None sentinel is received.
+    
+    Args:
+        nfo_queue: Queue filled by queue_nfo_files().
+        session: HTTP session used for Lidarr requests.
+        existing: Set of album IDs already in Lidarr.
+        seen: Set of album IDs already handled during this run.
+        
+    Returns:
+        Counter of process_nfo() results for the files this worker handled.
+    """
+    tally = Counter()
+    while True:
+        item = nfo_queue.get()
+        if item is None:
+            return tally
+        nfo_path, mb_id = item
+        tally[process_nfo(nfo_path, mb_id, session, existing, seen)] += 1
+
 def main() -> None:
     """Main function to process all album.nfo files and import to Lidarr.
     
-    Scans the configured music folder for album.nfo files, extracts MusicBrainz
-    IDs, and attempts to add each album to Lidarr. Prints a summary of results.
+    Scans the configured music folder for album.nfo files and extracts their
+    MusicBrainz IDs in the background while a small pool of worker threads
+    adds the albums to Lidarr, so that disk, parsing and request latency
+    overlap.
+    Prints a summary of results, and exits with status 1 if scanning failed
+    part way through.
     """
-    print(f"Scanning for album.nfo files in: {MUSIC_FOLDER_PATH}")
-    nfo_files = find_nfo_files(MUSIC_FOLDER_PATH)
-    print(f"Found {len(nfo_files)} album.nfo files\n")
-    
-    added = 0
-    failed = 0
-    skipped = 0
-    already_exists = 0
-    
-    for nfo_path in nfo_files:
-        print(f"Processing: {nfo_path}")
-        mb_id = extract_musicbrainz_id(nfo_path)
-        
-        if not mb_id:
-            print(f"  ✗ No MusicBrainz ID found")
-            skipped += 1
-            continue
+    # Spawned rather than forked parser processes: the pool starts its
+    # processes from the scanning thread while the workers are running
+    parse_context = multiprocessing.get_context("spawn")
+    scan_errors = []
+    with ProcessPoolExecutor(mp_context=parse_context) as pool, create_session() as session:
+        existing = get_existing_album_ids(session)
+        print(f"Lidarr already has {len(existing)} albums\n")
         
-        print(f"  Found ID: {mb_id}")
+        print(f"Scanning for album.nfo files in: {MUSIC_FOLDER_PATH}\n")
+        nfo_queue = queue.Queue(maxsize=NFO_QUEUE_SIZE)
+        threading.Thread(
+            target=queue_nfo_files,
+            args=(MUSIC_FOLDER_PATH, nfo_queue, MAX_WORKERS, pool, scan_errors),
+            daemon=True
+        ).start()
         
-        result = add_album_to_lidarr(mb_id)
-        if result is True:
-            added += 1
-        elif result is None:
-            already_exists += 1
-        else:
-            failed += 1
-        
-        print()
+        seen = set()
+        tally = Counter()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(process_queued_nfo_files, nfo_queue, session, existing, seen)
+                for _ in range(MAX_WORKERS)
+            ]
+            for future in futures:
+                tally.update(future.result())
     
     print("\n" + "="*50)
     print(f"Summary:")
-    print(f"  Total NFO files: {len(nfo_files)}")
-    print(f"  Successfully added: {added}")
-    print(f"  Already in Lidarr: {already_exists}")
-    print(f"  Failed: {failed}")
-    print(f"  Skipped (no ID): {skipped}")
+    print(f"  Total NFO files: {sum(tally.values())}")
+    print(f"  Successfully added: {tally['added']}")
+    print(f"  Already in Lidarr: {tally['already_exists']}")
+    print(f"  Failed: {tally['failed']}")
+    print(f"  Skipped (no ID): {tally['skipped']}")
+    print(f"  Duplicate IDs (processed once): {tally['duplicate']}")
     print("="*50)
+    
+    if scan_errors:
+        print("Scanning failed, so the summary only covers the files found before the error.")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
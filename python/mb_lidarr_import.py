@@ -12,11 +12,21 @@ Install: pip install requests musicbrainzngs
 
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import musicbrainzngs
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, List, Dict, Optional
 
 
+# Artists searched and added in Lidarr concurrently
+MAX_WORKERS = 6
+
+# Keeps each artist's output together when workers print at the same time
+_print_lock = threading.Lock()
+
 # Configure MusicBrainz API
 musicbrainzngs.set_useragent(
     "LidarrMusicBrainzImporter",
@@ -35,6 +45,7 @@ class LidarrAPI:
         url: Base URL of the Lidarr instance.
         api_key: API key for authentication.
         headers: HTTP headers used for API requests.
+        session: Pooled HTTP session that sends the headers on every request.
     """
     
     def __init__(self, url: str, api_key: str):
@@ -44,15 +55,23 @@ class LidarrAPI:
             'X-Api-Key': api_key,
             'Content-Type': 'application/json'
         }
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self.headers)
     
-    def get_root_folder(self) -> Optional[str]:
+    @cached_property
+    def root_folder(self) -> Optional[str]:
         """Get the first root folder path from Lidarr.
         
+        Fetched once per instance and cached.
+        
         Returns:
             The path of the first configured root folder, or None if unavailable.
         """
         try:
-            resp = requests.get(f'{self.url}/api/v1/rootfolder', headers=self.headers)
+            resp = self.session.get(f'{self.url}/api/v1/rootfolder')
             resp.raise_for_status()
             folders = resp.json()
             return folders[0]['path'] if folders else None
@@ -60,14 +79,17 @@ class LidarrAPI:
             print(f"Error getting root folder: {e}")
             return None
     
-    def get_quality_profile_id(self) -> Optional[int]:
+    @cached_property
+    def quality_profile_id(self) -> Optional[int]:
         """Get the first quality profile ID from Lidarr.
         
+        Fetched once per instance and cached.
+        
         Returns:
             The ID of the first configured quality profile, or None if unavailable.
         """
         try:
-            resp = requests.get(f'{self.url}/api/v1/qualityprofile', headers=self.headers)
+            resp = self.session.get(f'{self.url}/api/v1/qualityprofile')
             resp.raise_for_status()
             profiles = resp.json()
             return profiles[0]['id'] if profiles else None
@@ -75,14 +97,17 @@ class LidarrAPI:
             print(f"Error getting quality profile: {e}")
             return None
     
-    def get_metadata_profile_id(self) -> Optional[int]:
+    @cached_property
+    def metadata_profile_id(self) -> Optional[int]:
         """Get the first metadata profile ID from Lidarr.
         
+        Fetched once per instance and cached.
+        
         Returns:
             The ID of the first configured metadata profile, or None if unavailable.
         """
         try:
-            resp = requests.get(f'{self.url}/api/v1/metadataprofile', headers=self.headers)
+            resp = self.session.get(f'{self.url}/api/v1/metadataprofile')
             resp.raise_for_status()
             profiles = resp.json()
             return profiles[0]['id'] if profiles else None
@@ -90,31 +115,33 @@ class LidarrAPI:
             print(f"Error getting metadata profile: {e}")
             return None
     
-    def search_artist(self, mb_id: str) -> Optional[Dict]:
+    def search_artist(self, mb_id: str,
+                      log: Callable[[str], None] = print) -> Optional[Dict]:
         """Search for an artist by MusicBrainz ID in Lidarr.
         
         Args:
             mb_id: The MusicBrainz ID of the artist.
+            log: Called with each progress line. Defaults to print.
             
         Returns:
             Artist data dictionary if found, or None if not found.
         """
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 f'{self.url}/api/v1/search',
-                headers=self.headers,
                 params={'term': f'lidarr:{mb_id}'}
             )
             resp.raise_for_status()
             results = resp.json()
             return results[0] if results else None
         except Exception as e:
-            print(f"Error searching for artist {mb_id}: {e}")
+            log(f"  ❌ Error searching for artist {mb_id}: {e}")
             return None
     
     def add_artist(self, artist_data: Dict, root_folder: str, 
                    quality_profile: int, metadata_profile: int,
-                   monitor: bool = True, search: bool = False) -> bool:
+                   monitor: bool = True, search: bool = False,
+                   log: Callable[[str], None] = print) -> bool:
         """Add an artist to Lidarr.
         
         Args:
@@ -124,6 +151,7 @@ class LidarrAPI:
             metadata_profile: ID of the metadata profile to use.
             monitor: Whether to monitor the artist for new releases. Defaults to True.
             search: Whether to search for missing albums after adding. Defaults to False.
+            log: Called with each progress line. Defaults to print.
             
         Returns:
             True if artist was added successfully, False otherwise.
@@ -142,9 +170,8 @@ class LidarrAPI:
         }
         
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 f'{self.url}/api/v1/artist',
-                headers=self.headers,
                 json=payload
             )
             resp.raise_for_status()
@@ -153,12 +180,12 @@ class LidarrAPI:
             if e.response.status_code == 400:
                 error = e.response.json()
                 if 'Artist already exists' in str(error):
-                    print(f"  ⚠️  Artist already in Lidarr")
+                    log(f"  ⚠️  {artist_data['artistName']} already in Lidarr")
                     return False
-            print(f"  ❌ Error adding artist: {e}")
+            log(f"  ❌ Error adding {artist_data['artistName']}: {e}")
             return False
         except Exception as e:
-            print(f"  ❌ Error adding artist: {e}")
+            log(f"  ❌ Error adding {artist_data['artistName']}: {e}")
             return False
 
 
@@ -182,24 +209,20 @@ def get_release_artists(release_id: str) -> List[Dict]:
         )
         release = result['release']
         
-        artists = []
-        seen_ids = set()
+        # Keyed by MusicBrainz ID to drop duplicate credits while keeping order
+        artists = {}
         
         # Get main artist credits
-        if 'artist-credit' in release:
-            for credit in release['artist-credit']:
-                if isinstance(credit, dict) and 'artist' in credit:
-                    artist = credit['artist']
-                    mb_id = artist['id']
-                    if mb_id not in seen_ids:
-                        artists.append({
-                            'id': mb_id,
-                            'name': artist['name'],
-                            'sort_name': artist.get('sort-name', artist['name'])
-                        })
-                        seen_ids.add(mb_id)
+        for credit in release.get('artist-credit', []):
+            if isinstance(credit, dict) and 'artist' in credit:
+                artist = credit['artist']
+                artists.setdefault(artist['id'], {
+                    'id': artist['id'],
+                    'name': artist['name'],
+                    'sort_name': artist.get('sort-name', artist['name'])
+                })
         
-        return artists
+        return list(artists.values())
     
     except musicbrainzngs.WebServiceError as e:
         print(f"MusicBrainz error: {e}")
@@ -209,6 +232,54 @@ def get_release_artists(release_id: str) -> List[Dict]:
         return []
 
 
+def process_artist(artist: Dict, lidarr: LidarrAPI, root_folder: str,
+                   quality_profile: int, metadata_profile: int,
+                   monitor: bool = True, search: bool = False) -> bool:
+    """Search for a MusicBrainz artist in Lidarr and add it.
+    
+    Args:
+        artist: Artist dictionary from get_release_artists().
+        lidarr: Lidarr API client.
+        root_folder: Root folder path where artist files will be stored.
+        quality_profile: ID of the quality profile to use.
+        metadata_profile: ID of the metadata profile to use.
+        monitor: Whether to monitor the artist for new releases. Defaults to True.
+        search: Whether to search for missing albums after adding. Defaults to False.
+        
+    Returns:
+        True if the artist was added, False if it was skipped.
+    """
+    # Print the artist's lines as one block once it is done, so they are not
+    # interleaved with the other workers' output
+    lines = [f"Processing: {artist['name']} ({artist['id']})"]
+    
+    try:
+        # Search for artist in Lidarr
+        artist_data = lidarr.search_artist(artist['id'], log=lines.append)
+        
+        if not artist_data:
+            lines.append(f"  ⚠️  Could not find {artist['name']} in Lidarr search")
+            return False
+        
+        # Add artist
+        success = lidarr.add_artist(
+            artist_data,
+            root_folder,
+            quality_profile,
+            metadata_profile,
+            monitor=monitor,
+            search=search,
+            log=lines.append
+        )
+        
+        if success:
+            lines.append(f"  ✓ Added {artist['name']} successfully")
+        return success
+    finally:
+        with _print_lock:
+            print("\n".join(lines) + "\n")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Add all artists from a MusicBrainz release to Lidarr'
@@ -227,9 +298,9 @@ def main():
     
     # Get Lidarr configuration
     print("🔍 Getting Lidarr configuration...")
-    root_folder = lidarr.get_root_folder()
-    quality_profile = lidarr.get_quality_profile_id()
-    metadata_profile = lidarr.get_metadata_profile_id()
+    root_folder = lidarr.root_folder
+    quality_profile = lidarr.quality_profile_id
+    metadata_profile = lidarr.metadata_profile_id
     
     if not all([root_folder, quality_profile, metadata_profile]):
         print("❌ Could not get Lidarr configuration. Check your URL and API key.")
@@ -251,38 +322,23 @@ def main():
     print(f"✓ Found {len(artists)} artist(s)")
     print()
     
-    # Add each artist to Lidarr
-    added = 0
-    skipped = 0
+    # Add artists to Lidarr concurrently; only the MusicBrainz calls are rate limited
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(
+            lambda artist: process_artist(
+                artist,
+                lidarr,
+                root_folder,
+                quality_profile,
+                metadata_profile,
+                monitor=args.monitor,
+                search=args.search
+            ),
+            artists
+        ))
     
-    for artist in artists:
-        print(f"Processing: {artist['name']} ({artist['id']})")
-        
-        # Search for artist in Lidarr
-        artist_data = lidarr.search_artist(artist['id'])
-        
-        if not artist_data:
-            print(f"  ⚠️  Could not find artist in Lidarr search")
-            skipped += 1
-            continue
-        
-        # Add artist
-        success = lidarr.add_artist(
-            artist_data,
-            root_folder,
-            quality_profile,
-            metadata_profile,
-            monitor=args.monitor,
-            search=args.search
-        )
-        
-        if success:
-            print(f"  ✓ Added successfully")
-            added += 1
-        else:
-            skipped += 1
-        
-        print()
+    added = sum(results)
+    skipped = len(results) - added
     
     # Summary
     print("=" * 50)
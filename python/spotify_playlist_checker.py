@@ -14,8 +14,12 @@ Usage:
 Requirements:
     - spotipy: pip install spotipy
     - requests: pip install requests
+    - orjson (optional, faster JSON decoding): pip install orjson
+    - tqdm (optional, progress bar): pip install tqdm
     - Spotify API credentials (SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET)
 
+MusicBrainz lookups are cached for 7 days in ~/.cache/spotify_pl_checker.db.
+
 Example:
     export SPOTIPY_CLIENT_ID="your_client_id"
     export SPOTIPY_CLIENT_SECRET="your_client_secret"
@@ -23,15 +27,23 @@ Example:
 """
 
 import argparse
+import csv
+import itertools
+import json
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
-from typing import Dict, List
-from urllib.parse import urlparse
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library not installed. Install with: pip install requests")
     sys.exit(1)
@@ -43,68 +55,364 @@ except ImportError:
     print("Error: spotipy library not installed. Install with: pip install spotipy")
     sys.exit(1)
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
 # MusicBrainz API configuration
 MB_API_URL = "https://musicbrainz.org/ws/2"
 MB_USER_AGENT = "SpotifyPlaylistChecker/1.0 (https://github.com/yourusername/yourproject)"
 MB_RATE_LIMIT = 1.0  # Seconds between requests (MusicBrainz requires 1 request per second)
-
-# Streaming service URL patterns
-SERVICE_PATTERNS = {
-    "spotify": r"open\.spotify\.com/artist/",
-    "tidal": r"tidal\.com/artist/",
-    "deezer": r"deezer\.com/artist/",
+MB_MAX_WORKERS = 4  # Artists checked concurrently; requests are still paced by MB_RATE_LIMIT
+MB_MAX_IN_FLIGHT = 4  # MusicBrainz requests allowed on the wire at once, across all threads
+MB_MAX_RETRIES = 3  # Retries of a request MusicBrainz answered with an MB_RETRY_STATUSES code
+MB_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Retried in _get, through the rate limiter
+MB_SEARCH_BATCH_SIZE = 25  # Spotify artist URLs looked up together in a single MusicBrainz request
+MB_CACHE_PATH = os.path.expanduser("~/.cache/spotify_pl_checker.db")  # Lookup cache between runs
+MB_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds before a cached lookup is fetched again
+
+# Spotify playlist pagination
+SPOTIFY_PAGE_SIZE = 100  # Maximum tracks per playlist_items request
+SPOTIFY_MAX_WORKERS = 4  # Playlist pages fetched concurrently
+SPOTIFY_ITEM_FIELDS = "total,items(track(artists(id,name)))"  # Only what we use
+SPOTIFY_PLAYLIST_FIELDS = "name,owner(display_name),tracks(total)"  # Header info only
+
+# Streaming service artist URL fragments (matched against lowercased URLs)
+SERVICE_SUBSTRINGS = {
+    "spotify": "open.spotify.com/artist/",
+    "tidal": "tidal.com/artist/",
+    "deezer": "deezer.com/artist/",
 }
 
+# Bit flag per streaming service in a result's "flags"
+SERVICE_BITS = {"spotify": 1, "tidal": 2, "deezer": 4}
+ALL_SERVICES = 7  # Every bit in SERVICE_BITS set
+
+# Spotify playlist ID in a spotify: URI or open.spotify.com URL
+SPOTIFY_PLAYLIST_URL = re.compile(
+    r"^(?:spotify:playlist:|https?://open\.spotify\.com/(?:embed/)?playlist/)"
+    r"([A-Za-z0-9]{22})(?![A-Za-z0-9])"
+)
+
+# Spotify artist ID in a MusicBrainz URL relation
+SPOTIFY_ARTIST_URL = re.compile(r"open\.spotify\.com/artist/([A-Za-z0-9]+)", re.IGNORECASE)
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    # Consecutive successes needed before a slowed-down rate is doubled again
+    RECOVERY_STREAK = 10
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        """
+        Initialize token bucket.
+
+        Args:
+            requests_per_second: Rate at which tokens are refilled
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.requests_per_second = requests_per_second
+        self.max_rate = requests_per_second
+        self.min_rate = requests_per_second / 8
+        self.successes = 0
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Take a token, sleeping until one is available.
+
+        The token is reserved under the lock (the balance may go negative),
+        and the wait happens outside it so other threads can queue up behind.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst,
+                self.tokens + (now - self.updated) * self.requests_per_second,
+            )
+            self.updated = now
+            self.tokens -= 1
+            deficit = -self.tokens
+        if deficit > 0:
+            time.sleep(deficit / self.requests_per_second)
+
+    def slow_down(self) -> None:
+        """Halve the refill rate after the server asked us to back off."""
+        with self._lock:
+            self.requests_per_second = max(self.min_rate, self.requests_per_second / 2)
+            self.successes = 0
+
+    def record_success(self) -> None:
+        """Count a successful request, restoring the rate after a streak."""
+        with self._lock:
+            if self.requests_per_second >= self.max_rate:
+                return
+            self.successes += 1
+            if self.successes >= self.RECOVERY_STREAK:
+                self.requests_per_second = min(self.max_rate, self.requests_per_second * 2)
+                self.successes = 0
+
 
 class MusicBrainzClient:
     """Client for interacting with MusicBrainz API with rate limiting."""
 
-    def __init__(self, user_agent: str):
+    def __init__(self, user_agent: str, cache_path: Optional[str] = MB_CACHE_PATH):
         """
         Initialize MusicBrainz client.
 
         Args:
             user_agent: User agent string for API requests
+            cache_path: SQLite file caching lookups by Spotify ID, or None to disable
         """
         self.session = requests.Session()
         self.session.headers.update(
             {"User-Agent": user_agent, "Accept": "application/json"}
         )
-        self.last_request_time = 0
+        # Reuse connections across worker threads and retry connection errors.
+        # Error statuses are retried in _get so the retries go through the limiter.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=()),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Enforce rate limiting to comply with MusicBrainz API requirements
+        self.limiter = TokenBucket(1 / MB_RATE_LIMIT, burst=1)
+        # Caps open requests for every caller sharing this client; only the
+        # dispatch is paced, so response handling overlaps the next request
+        self._in_flight = threading.BoundedSemaphore(MB_MAX_IN_FLIGHT)
+        self.cache = self._open_cache(cache_path) if cache_path else None
+
+    @staticmethod
+    def _open_cache(cache_path: str) -> Optional[sqlite3.Connection]:
+        """
+        Open the lookup cache, creating it if needed.
+
+        Args:
+            cache_path: Path of the SQLite cache file
+
+        Returns:
+            Database connection, or None if the cache cannot be used
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            cache = sqlite3.connect(cache_path)
+            cache.execute(
+                "CREATE TABLE IF NOT EXISTS mb "
+                "(spotify_id TEXT PRIMARY KEY, mbid TEXT, relations TEXT, ts REAL)"
+            )
+            return cache
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: MusicBrainz cache disabled: {e}", file=sys.stderr)
+            return None
+
+    def get_cached_lookups(
+        self, spotify_ids: List[str]
+    ) -> Dict[str, Tuple[Optional[str], List[Dict]]]:
+        """
+        Get cached lookups that are younger than MB_CACHE_TTL.
+
+        Args:
+            spotify_ids: Spotify artist IDs
+
+        Returns:
+            Dictionary mapping Spotify ID to (MusicBrainz artist ID, URL
+            relations). The MusicBrainz ID is None for artists known to be
+            missing from MusicBrainz.
+        """
+        if not self.cache:
+            return {}
+
+        lookups = {}
+        cutoff = time.time() - MB_CACHE_TTL
+        # Stay well below SQLite's limit on query parameters
+        for start in range(0, len(spotify_ids), 500):
+            batch = spotify_ids[start:start + 500]
+            rows = self.cache.execute(
+                "SELECT spotify_id, mbid, relations FROM mb WHERE ts >= ? "
+                f"AND spotify_id IN ({','.join('?' * len(batch))})",
+                [cutoff, *batch],
+            )
+            for spotify_id, mbid, relations in rows:
+                lookups[spotify_id] = (mbid, json_loads(relations))
+        return lookups
+
+    def cache_lookups(
+        self, lookups: Dict[str, Tuple[Optional[str], List[Dict]]]
+    ) -> None:
+        """
+        Store lookups in the cache.
 
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting to comply with MusicBrainz API requirements."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < MB_RATE_LIMIT:
-            time.sleep(MB_RATE_LIMIT - elapsed)
-        self.last_request_time = time.time()
+        Args:
+            lookups: Dictionary mapping Spotify ID to (MusicBrainz artist ID,
+                URL relations), as returned by get_cached_lookups()
+        """
+        if not self.cache:
+            return
+
+        now = time.time()
+        with self.cache:
+            self.cache.executemany(
+                "INSERT OR REPLACE INTO mb VALUES (?, ?, ?, ?)",
+                [
+                    (spotify_id, mbid, json.dumps(relations), now)
+                    for spotify_id, (mbid, relations) in lookups.items()
+                ],
+            )
 
-    def search_artist_by_spotify_id(self, spotify_id: str) -> Dict:
+    def _get(self, path: str, params: Dict) -> requests.Response:
         """
-        Search for artist in MusicBrainz by Spotify ID.
+        Send a rate limited GET request to the MusicBrainz API.
+
+        When MusicBrainz answers with one of MB_RETRY_STATUSES the request is
+        retried up to MB_MAX_RETRIES times after waiting for its Retry-After
+        header, or an exponential backoff without one, and the limiter slows
+        down until a streak of successful requests.
 
         Args:
-            spotify_id: Spotify artist ID
+            path: API path below MB_API_URL
+            params: Query parameters
 
         Returns:
-            Dictionary containing search results or empty dict on error
+            Response object
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        for attempt in range(MB_MAX_RETRIES + 1):
+            with self._in_flight:
+                self.limiter.acquire()
+                response = self.session.get(f"{MB_API_URL}/{path}", params=params)
+
+            if response.status_code not in MB_RETRY_STATUSES or attempt == MB_MAX_RETRIES:
+                break
+
+            self.limiter.slow_down()
+            try:
+                delay = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                delay = MB_RATE_LIMIT * 2 ** attempt
+            print(
+                f"Warning: MusicBrainz returned {response.status_code}, "
+                f"retrying in {delay:.0f}s",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+
+        response.raise_for_status()
+        self.limiter.record_success()
+        return response
+
+    def search_artists_by_spotify_ids(self, spotify_ids: List[str]) -> Optional[Dict]:
         """
-        self._rate_limit()
+        Search for artists in MusicBrainz by Spotify ID with a single request.
 
+        Args:
+            spotify_ids: Spotify artist IDs, OR-ed together in one query
+
+        Returns:
+            Dictionary containing search results, or None on error
+        """
         params = {
-            "query": f'url:"https://open.spotify.com/artist/{spotify_id}"',
+            "query": " OR ".join(
+                f'url:"https://open.spotify.com/artist/{spotify_id}"'
+                for spotify_id in spotify_ids
+            ),
             "fmt": "json",
+            "limit": 100,
         }
 
         try:
-            response = self.session.get(f"{MB_API_URL}/artist", params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return json_loads(self._get("artist", params).content)
+        except (requests.RequestException, ValueError) as e:
             print(f"Warning: MusicBrainz API error: {e}", file=sys.stderr)
-            return {}
+            return None
+
+    def lookup_artists_by_spotify_ids(self, spotify_ids: List[str]) -> Optional[List[str]]:
+        """
+        Look up the MusicBrainz artists linked to Spotify IDs by exact URL.
+
+        Unlike a search, the URL lookup only returns artists that really are
+        linked to one of the URLs and does not lag behind the search index.
 
-    def get_artist_urls(self, mb_artist_id: str) -> List[Dict]:
+        Args:
+            spotify_ids: Spotify artist IDs, looked up in one request
+
+        Returns:
+            List of MusicBrainz artist IDs, empty if MusicBrainz knows none
+            of the URLs, or None if the request failed
+        """
+        params = {
+            "resource": [
+                f"https://open.spotify.com/artist/{spotify_id}" for spotify_id in spotify_ids
+            ],
+            "inc": "artist-rels",
+            "fmt": "json",
+        }
+
+        try:
+            data = json_loads(self._get("url", params).content)
+        except (requests.RequestException, ValueError) as e:
+            # 404 is an exact answer: none of the URLs are in MusicBrainz
+            if getattr(getattr(e, "response", None), "status_code", None) == 404:
+                return []
+            print(f"Warning: MusicBrainz API error: {e}", file=sys.stderr)
+            return None
+
+        # Several resources give a list of URLs, a single one the URL itself
+        mb_artist_ids = []
+        for url in data.get("urls", [data]):
+            for relation in url.get("relations", []):
+                if "artist" in relation:
+                    mb_artist_ids.append(relation["artist"]["id"])
+        return mb_artist_ids
+
+    def batch_lookup(
+        self, spotify_ids: List[str], batch_size: int = MB_SEARCH_BATCH_SIZE
+    ) -> Tuple[List[str], bool]:
+        """
+        Find the MusicBrainz artists linked to any of the given Spotify IDs.
+
+        Looks up batch_size Spotify URLs per request instead of one, and
+        falls back to a search only when the lookup request fails.
+        Neither says which URL each artist matched, so callers map artists
+        back to Spotify IDs through their URL relations.
+
+        Args:
+            spotify_ids: Spotify artist IDs
+            batch_size: Number of Spotify IDs per search request
+
+        Returns:
+            Tuple of (unique MusicBrainz artist IDs in result order,
+            whether every batch was looked up or searched successfully)
+        """
+        mb_artist_ids = {}
+        complete = True
+        for start in range(0, len(spotify_ids), batch_size):
+            batch = spotify_ids[start:start + batch_size]
+            found = self.lookup_artists_by_spotify_ids(batch)
+            if found is None:
+                mb_search = self.search_artists_by_spotify_ids(batch)
+                if mb_search is None:
+                    complete = False
+                    continue
+                found = [mb_artist["id"] for mb_artist in mb_search.get("artists", [])]
+            for mb_artist_id in found:
+                mb_artist_ids.setdefault(mb_artist_id, None)
+        return list(mb_artist_ids), complete
+
+    def get_artist_urls(self, mb_artist_id: str) -> Optional[List[Dict]]:
         """
         Get all URLs for an artist from MusicBrainz.
 
@@ -112,22 +420,16 @@ class MusicBrainzClient:
             mb_artist_id: MusicBrainz artist ID
 
         Returns:
-            List of relation dictionaries containing URLs
+            List of relation dictionaries containing URLs, or None on error
         """
-        self._rate_limit()
-
         params = {"inc": "url-rels", "fmt": "json"}
 
         try:
-            response = self.session.get(
-                f"{MB_API_URL}/artist/{mb_artist_id}", params=params
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = json_loads(self._get(f"artist/{mb_artist_id}", params).content)
             return data.get("relations", [])
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Warning: MusicBrainz API error: {e}", file=sys.stderr)
-            return []
+            return None
 
 
 def extract_playlist_id(playlist_url: str) -> str:
@@ -149,21 +451,14 @@ def extract_playlist_id(playlist_url: str) -> str:
         >>> extract_playlist_id("spotify:playlist:37i9dQZF1DXcBWIGoYBM5M")
         '37i9dQZF1DXcBWIGoYBM5M'
     """
-    # Handle spotify: URI format
-    if playlist_url.startswith("spotify:playlist:"):
-        return playlist_url.split(":")[-1]
-
-    # Handle https URL format
-    parsed = urlparse(playlist_url)
-    if "open.spotify.com" in parsed.netloc:
-        path_parts = parsed.path.strip("/").split("/")
-        if len(path_parts) >= 2 and path_parts[0] == "playlist":
-            return path_parts[1].split("?")[0]
+    # Pasted URLs often carry surrounding whitespace
+    match = SPOTIFY_PLAYLIST_URL.match(playlist_url.strip())
+    if not match:
+        raise ValueError(f"Invalid Spotify playlist URL: {playlist_url}")
+    return match.group(1)
 
-    raise ValueError(f"Invalid Spotify playlist URL: {playlist_url}")
 
-
-def check_streaming_services(relations: List[Dict]) -> Dict[str, bool]:
+def check_streaming_services(relations: List[Dict]) -> int:
     """
     Check which streaming services are linked in MusicBrainz relations.
 
@@ -171,55 +466,87 @@ def check_streaming_services(relations: List[Dict]) -> Dict[str, bool]:
         relations: List of MusicBrainz relation dictionaries
 
     Returns:
-        Dictionary with boolean values for each service
+        SERVICE_BITS flags of the linked services OR'd together
     """
-    services = {"spotify": False, "tidal": False, "deezer": False}
+    flags = 0
 
     for relation in relations:
         if relation.get("type") == "streaming" and "url" in relation:
-            url = relation["url"].get("resource", "")
+            url = relation["url"].get("resource", "").lower()
+
+            for service, substring in SERVICE_SUBSTRINGS.items():
+                if substring in url:
+                    flags |= SERVICE_BITS[service]
 
-            for service, pattern in SERVICE_PATTERNS.items():
-                if re.search(pattern, url, re.IGNORECASE):
-                    services[service] = True
+            # Nothing left to find once every service is linked
+            if flags == ALL_SERVICES:
+                return flags
 
-    return services
+    return flags
 
 
-def get_playlist_artists(spotify_client, playlist_id: str) -> List[Dict]:
+def iter_playlist_tracks(spotify_client, playlist_id: str) -> Iterator[Dict]:
     """
-    Get unique artists from a Spotify playlist.
+    Yield the track items of a Spotify playlist page by page.
+
+    The first page gives the total, the rest are fetched concurrently with
+    at most SPOTIFY_MAX_WORKERS pages requested ahead of the consumer. Each
+    page is released once its items have been yielded.
 
     Args:
         spotify_client: Initialized Spotipy client
         playlist_id: Spotify playlist ID
 
-    Returns:
-        List of dictionaries containing artist id and name
+    Yields:
+        Playlist item dictionaries
     """
-    artists_dict = {}
 
-    try:
-        results = spotify_client.playlist_tracks(playlist_id)
-        tracks = results["items"]
+    def fetch_page(offset: int) -> Dict:
+        return spotify_client.playlist_items(
+            playlist_id,
+            fields=SPOTIFY_ITEM_FIELDS,
+            limit=SPOTIFY_PAGE_SIZE,
+            offset=offset,
+            additional_types=["track"],
+        )
+
+    results = fetch_page(0)
+    yield from results["items"]
+
+    offsets = iter(range(SPOTIFY_PAGE_SIZE, results["total"], SPOTIFY_PAGE_SIZE))
+    with ThreadPoolExecutor(max_workers=SPOTIFY_MAX_WORKERS) as executor:
+        # Sliding window: a slow consumer never has the whole playlist buffered
+        pages = deque(
+            executor.submit(fetch_page, offset)
+            for offset in itertools.islice(offsets, SPOTIFY_MAX_WORKERS)
+        )
+        while pages:
+            page = pages.popleft().result()
+            for offset in itertools.islice(offsets, 1):
+                pages.append(executor.submit(fetch_page, offset))
+            yield from page["items"]
+
 
-        # Handle pagination
-        while results["next"]:
-            results = spotify_client.next(results)
-            tracks.extend(results["items"])
+def iter_playlist_artists(spotify_client, playlist_id: str) -> Iterator[Dict]:
+    """
+    Yield the unique artists of a Spotify playlist as its pages arrive.
+
+    Args:
+        spotify_client: Initialized Spotipy client
+        playlist_id: Spotify playlist ID
 
-        # Extract unique artists
-        for item in tracks:
+    Yields:
+        Dictionaries containing artist id and name
+    """
+    seen = set()
+
+    try:
+        for item in iter_playlist_tracks(spotify_client, playlist_id):
             if item["track"] and item["track"]["artists"]:
                 for artist in item["track"]["artists"]:
-                    artist_id = artist["id"]
-                    if artist_id not in artists_dict:
-                        artists_dict[artist_id] = {
-                            "id": artist_id,
-                            "name": artist["name"],
-                        }
-
-        return list(artists_dict.values())
+                    if artist["id"] not in seen:
+                        seen.add(artist["id"])
+                        yield {"id": artist["id"], "name": artist["name"]}
 
     except Exception as e:
         print(f"Error fetching playlist: {e}", file=sys.stderr)
@@ -238,11 +565,27 @@ def print_summary(results: List[Dict]) -> None:
     print("=" * 70)
 
     total = len(results)
-    in_mb = sum(1 for r in results if r["mb_found"])
-    has_spotify = sum(1 for r in results if r["services"]["spotify"])
-    has_tidal = sum(1 for r in results if r["services"]["tidal"])
-    has_deezer = sum(1 for r in results if r["services"]["deezer"])
-    has_all = sum(1 for r in results if all(r["services"].values()))
+    if not total:
+        print("\nNo artists to summarize")
+        return
+
+    # Count everything in a single pass over the results
+    counts = Counter()
+    missing_any = []
+    for r in results:
+        flags = r["flags"]
+        counts["in_mb"] += r["mb_found"]
+        counts.update(service for service, bit in SERVICE_BITS.items() if flags & bit)
+        if flags == ALL_SERVICES:
+            counts["all"] += 1
+        elif r["mb_found"]:
+            missing_any.append(r)
+
+    in_mb = counts["in_mb"]
+    has_spotify = counts["spotify"]
+    has_tidal = counts["tidal"]
+    has_deezer = counts["deezer"]
+    has_all = counts["all"]
 
     print(f"\nTotal artists: {total}")
     print(f"Found in MusicBrainz: {in_mb} ({in_mb/total*100:.1f}%)")
@@ -253,13 +596,10 @@ def print_summary(results: List[Dict]) -> None:
     print(f"  All three: {has_all} ({has_all/total*100:.1f}%)")
 
     # Show artists missing from services
-    missing_any = [
-        r for r in results if r["mb_found"] and not all(r["services"].values())
-    ]
     if missing_any:
         print(f"\n{len(missing_any)} artists missing from one or more services:")
         for r in missing_any[:10]:  # Show first 10
-            missing = [s for s, v in r["services"].items() if not v]
+            missing = [s for s, bit in SERVICE_BITS.items() if not r["flags"] & bit]
             print(f"  • {r['name']} - missing: {', '.join(missing)}")
 
         if len(missing_any) > 10:
@@ -267,36 +607,257 @@ def print_summary(results: List[Dict]) -> None:
             print(f"\nUse --missing-only --output detailed for full list")
 
 
-def print_detailed(results: List[Dict]) -> None:
+def print_detailed(results: Iterable[Dict]) -> None:
     """
-    Print detailed information for each artist.
+    Print detailed information for each artist as results arrive.
 
     Args:
-        results: List of result dictionaries for each artist
+        results: Result dictionaries for each artist
     """
     for r in results:
         print(f"\n{r['name']}")
         print(f"  Spotify ID: {r['spotify_id']}")
         print(f"  In MusicBrainz: {'Yes' if r['mb_found'] else 'No'}")
         if r["mb_found"]:
-            print(f"  Has Spotify link: {'✓' if r['services']['spotify'] else '✗'}")
-            print(f"  Has Tidal link: {'✓' if r['services']['tidal'] else '✗'}")
-            print(f"  Has Deezer link: {'✓' if r['services']['deezer'] else '✗'}")
+            flags = r["flags"]
+            print(f"  Has Spotify link: {'✓' if flags & SERVICE_BITS['spotify'] else '✗'}")
+            print(f"  Has Tidal link: {'✓' if flags & SERVICE_BITS['tidal'] else '✗'}")
+            print(f"  Has Deezer link: {'✓' if flags & SERVICE_BITS['deezer'] else '✗'}")
+        sys.stdout.flush()
 
 
-def print_csv(results: List[Dict]) -> None:
+def print_csv(results: Iterable[Dict]) -> None:
     """
-    Print results in CSV format.
+    Print results in CSV format, one row as each result arrives.
 
     Args:
-        results: List of result dictionaries for each artist
+        results: Result dictionaries for each artist
     """
-    print("Artist,Spotify ID,In MusicBrainz,Has Spotify,Has Tidal,Has Deezer")
+    # csv.writer quotes artist names that contain commas or quotes
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    writer.writerow(
+        ["Artist", "Spotify ID", "In MusicBrainz", "Has Spotify", "Has Tidal", "Has Deezer"]
+    )
     for r in results:
-        print(
-            f"{r['name']},{r['spotify_id']},{r['mb_found']},"
-            f"{r['services']['spotify']},{r['services']['tidal']},{r['services']['deezer']}"
+        writer.writerow(
+            (
+                r["name"],
+                r["spotify_id"],
+                r["mb_found"],
+                bool(r["flags"] & SERVICE_BITS["spotify"]),
+                bool(r["flags"] & SERVICE_BITS["tidal"]),
+                bool(r["flags"] & SERVICE_BITS["deezer"]),
+            )
         )
+        # Let a downstream pipe start on each row straight away
+        sys.stdout.flush()
+
+
+def track_progress(iterable, total: int, desc: str) -> Iterator:
+    """
+    Show progress on stderr while iterating.
+
+    Uses tqdm when it is installed. Otherwise a single status line is
+    rewritten at most ten times per second.
+
+    Args:
+        iterable: Items to iterate over
+        total: Expected number of items
+        desc: Label shown before the counter
+
+    Yields:
+        The items of iterable
+    """
+    if tqdm is not None:
+        yield from tqdm(iterable, total=total, desc=desc, unit="artist")
+        return
+
+    last_update = 0.0
+    for i, item in enumerate(iterable, 1):
+        now = time.monotonic()
+        if now - last_update >= 0.1 or i == total:
+            print(f"[{i}/{total}] {desc}...", end="\r", file=sys.stderr, flush=True)
+            last_update = now
+        yield item
+    if total:
+        print(file=sys.stderr)
+
+
+def get_linked_spotify_ids(relations: List[Dict]) -> List[str]:
+    """
+    Get the Spotify artist IDs linked in MusicBrainz relations.
+
+    Args:
+        relations: List of MusicBrainz relation dictionaries
+
+    Returns:
+        List of Spotify artist IDs
+    """
+    spotify_ids = []
+    for relation in relations:
+        match = SPOTIFY_ARTIST_URL.search(relation.get("url", {}).get("resource", ""))
+        if match:
+            spotify_ids.append(match.group(1))
+    return spotify_ids
+
+
+def build_result(artist: Dict, mb_artist_id: Optional[str], relations: List[Dict]) -> Dict:
+    """
+    Build the result dictionary reported for one playlist artist.
+
+    Args:
+        artist: Dictionary containing Spotify artist id and name
+        mb_artist_id: MusicBrainz artist ID, or None if not in MusicBrainz
+        relations: List of MusicBrainz relation dictionaries
+
+    Returns:
+        Result dictionary with name, spotify_id, mb_found and flags
+    """
+    return {
+        "name": artist["name"],
+        "spotify_id": artist["id"],
+        "mb_found": mb_artist_id is not None,
+        "flags": check_streaming_services(relations),
+    }
+
+
+def iter_checked_artists(mb_client: MusicBrainzClient, artists: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Look up Spotify artists in MusicBrainz and yield results as they finish.
+
+    Artists are consumed as they arrive, so MusicBrainz searches start while
+    the rest of the playlist is still being fetched. Cached artists are
+    reported straight away. Uncached artists are looked up in batches, the URL
+    relations of every MusicBrainz artist found are fetched concurrently, and
+    each playlist artist is reported as soon as a relation links back to it.
+    Artists nothing links back to are reported last as not in MusicBrainz.
+
+    Lookups finished so far are cached even if iteration is stopped early.
+
+    Args:
+        mb_client: Initialized MusicBrainz client
+        artists: Dictionaries containing Spotify artist id and name
+
+    Yields:
+        Result dictionaries with name, spotify_id, mb_found and flags
+    """
+    # Spotify artist ID -> playlist artist still waiting for a result
+    unresolved = {}
+    pending = []
+    # URL relation future -> MusicBrainz artist ID, until it is reported
+    url_lookups = {}
+    submitted = set()
+    # Spotify artist ID -> (MusicBrainz artist ID, URL relations) to cache
+    fetched = {}
+    checked = 0
+    cached = 0
+    complete = True
+
+    executor = ThreadPoolExecutor(max_workers=MB_MAX_WORKERS)
+
+    def search(spotify_ids: List[str]) -> None:
+        nonlocal complete
+        mb_artist_ids, searched = mb_client.batch_lookup(spotify_ids)
+        complete = complete and searched
+        for mb_artist_id in mb_artist_ids:
+            if mb_artist_id not in submitted:
+                submitted.add(mb_artist_id)
+                url_lookups[executor.submit(mb_client.get_artist_urls, mb_artist_id)] = mb_artist_id
+
+    def resolve(future) -> Iterator[Dict]:
+        nonlocal complete
+        mb_artist_id = url_lookups.pop(future)
+        relations = future.result()
+        if relations is None:
+            complete = False
+            return
+        for spotify_id in get_linked_spotify_ids(relations):
+            if spotify_id not in fetched:
+                fetched[spotify_id] = (mb_artist_id, relations)
+            artist = unresolved.pop(spotify_id, None)
+            if artist is not None:
+                yield build_result(artist, mb_artist_id, relations)
+
+    try:
+        artist_iter = iter(artists)
+        while True:
+            batch = list(itertools.islice(artist_iter, MB_SEARCH_BATCH_SIZE))
+            if not batch:
+                break
+            checked += len(batch)
+
+            spotify_ids = [artist["id"] for artist in batch if artist["id"]]
+            lookups = mb_client.get_cached_lookups(spotify_ids)
+            cached += len(lookups)
+            batch_misses = []
+            for artist in batch:
+                if artist["id"] in lookups:
+                    yield build_result(artist, *lookups[artist["id"]])
+                elif artist["id"] in fetched:
+                    # Linked from a MusicBrainz artist already fetched for an earlier batch
+                    yield build_result(artist, *fetched[artist["id"]])
+                elif artist["id"]:
+                    unresolved[artist["id"]] = artist
+                    batch_misses.append(artist["id"])
+                else:
+                    yield build_result(artist, None, [])
+
+            # Search only full batches until the playlist is exhausted
+            pending.extend(batch_misses)
+            while len(pending) >= MB_SEARCH_BATCH_SIZE:
+                search(pending[:MB_SEARCH_BATCH_SIZE])
+                pending = pending[MB_SEARCH_BATCH_SIZE:]
+
+            # Report lookups that finished while the playlist was downloading
+            for future in [future for future in url_lookups if future.done()]:
+                yield from resolve(future)
+        if pending:
+            search(pending)
+
+        # Results are streamed to stdout, so status goes to stderr
+        print(f"Found {checked} unique artists", file=sys.stderr)
+        if cached:
+            print(f"Using cached MusicBrainz lookups for {cached} artists", file=sys.stderr)
+
+        remaining = list(url_lookups)
+        if remaining:
+            lookups_done = track_progress(as_completed(remaining), len(remaining), "MusicBrainz lookups")
+            for future in lookups_done:
+                yield from resolve(future)
+
+        # Only remember misses as "not in MusicBrainz" when no request failed
+        for artist in unresolved.values():
+            if complete:
+                fetched.setdefault(artist["id"], (None, []))
+            yield build_result(artist, None, [])
+    finally:
+        executor.shutdown(cancel_futures=True)
+        mb_client.cache_lookups(fetched)
+
+
+def create_spotify_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all Spotify API calls.
+
+    Playlist pages are fetched concurrently, so the connection pool is sized
+    for that and rate limiting or server errors are retried here.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
 
 
 def check_spotify_credentials() -> tuple:
@@ -367,12 +928,17 @@ def main():
     # Check for Spotify credentials
     client_id, client_secret = check_spotify_credentials()
 
-    # Initialize Spotify client
+    # Initialize Spotify client; retries are handled by the shared session
+    spotify_session = create_spotify_session()
     try:
         spotify = spotipy.Spotify(
             client_credentials_manager=SpotifyClientCredentials(
-                client_id=client_id, client_secret=client_secret
-            )
+                client_id=client_id,
+                client_secret=client_secret,
+                requests_session=spotify_session,
+            ),
+            requests_session=spotify_session,
+            retries=0,
         )
     except Exception as e:
         print(f"Error initializing Spotify client: {e}", file=sys.stderr)
@@ -391,7 +957,7 @@ def main():
     # Get playlist info
     print(f"Fetching playlist information...")
     try:
-        playlist = spotify.playlist(playlist_id)
+        playlist = spotify.playlist(playlist_id, fields=SPOTIFY_PLAYLIST_FIELDS)
         print(f"Playlist: {playlist['name']}")
         print(f"Owner: {playlist['owner']['display_name']}")
         print(f"Total tracks: {playlist['tracks']['total']}\n")
@@ -399,56 +965,27 @@ def main():
         print(f"Error fetching playlist info: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Get artists
-    print("Fetching artists from playlist...")
-    artists = get_playlist_artists(spotify, playlist_id)
-    print(f"Found {len(artists)} unique artists\n")
-
-    # Check each artist in MusicBrainz
-    print("Checking MusicBrainz for streaming service links...")
+    # Check each artist in MusicBrainz while the playlist is still being fetched
+    print("Fetching artists and checking MusicBrainz for streaming service links...")
     print("(This may take a while due to API rate limiting)\n")
 
-    results = []
-
-    for i, artist in enumerate(artists, 1):
-        print(f"[{i}/{len(artists)}] Checking {artist['name']}...", end="\r")
-
-        # Search MusicBrainz by Spotify ID
-        mb_search = mb_client.search_artist_by_spotify_id(artist["id"])
-
-        services = {"spotify": False, "tidal": False, "deezer": False}
-        mb_found = False
-
-        if mb_search.get("artists"):
-            mb_artist = mb_search["artists"][0]
-            mb_found = True
-
-            # Get URLs for the artist
-            relations = mb_client.get_artist_urls(mb_artist["id"])
-            services = check_streaming_services(relations)
-
-        results.append(
-            {
-                "name": artist["name"],
-                "spotify_id": artist["id"],
-                "mb_found": mb_found,
-                "services": services,
-            }
-        )
-
-    print()  # Clear the progress line
+    results = iter_checked_artists(mb_client, iter_playlist_artists(spotify, playlist_id))
 
     # Filter results if requested
     if args.missing_only:
-        results = [r for r in results if not all(r["services"].values())]
-
-    # Output results based on format
-    if args.output == "csv":
-        print_csv(results)
-    elif args.output == "detailed":
-        print_detailed(results)
-    else:  # summary
-        print_summary(results)
+        results = (r for r in results if r["flags"] != ALL_SERVICES)
+
+    # Output results based on format; csv and detailed stream as results arrive
+    try:
+        if args.output == "csv":
+            print_csv(results)
+        elif args.output == "detailed":
+            print_detailed(results)
+        else:  # summary
+            print_summary(list(results))
+    except KeyboardInterrupt:
+        print("\nInterrupted", file=sys.stderr)
+        sys.exit(130)
 
 
 if __name__ == "__main__":
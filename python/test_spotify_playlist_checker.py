@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for spotify_playlist_checker.
+
+Usage:
+    python -m unittest test_spotify_playlist_checker
+"""
+
+import unittest
+from unittest import mock
+
+import spotify_playlist_checker as checker
+
+
+class FakeMusicBrainzClient:
+    """MusicBrainz client where one artist is linked to two Spotify IDs."""
+
+    LINKED_IDS = ("sp000", "sp050")
+
+    def __init__(self):
+        self.cached = {}
+
+    def get_cached_lookups(self, spotify_ids):
+        return {}
+
+    def cache_lookups(self, lookups):
+        self.cached.update(lookups)
+
+    def batch_lookup(self, spotify_ids):
+        found = ["mbA"] if set(self.LINKED_IDS) & set(spotify_ids) else []
+        return found, True
+
+    def get_artist_urls(self, mb_artist_id):
+        return [
+            {"type": "streaming", "url": {"resource": f"https://open.spotify.com/artist/{sid}"}}
+            for sid in self.LINKED_IDS
+        ] + [{"type": "streaming", "url": {"resource": "https://tidal.com/artist/1"}}]
+
+
+class IterCheckedArtistsTest(unittest.TestCase):
+    def test_artist_linked_from_earlier_batch(self):
+        """A Spotify ID linked from an artist fetched for an earlier batch is found."""
+        artists = [{"id": f"sp{i:03d}", "name": f"Artist {i}"} for i in range(60)]
+        mb_client = FakeMusicBrainzClient()
+
+        def playlist():
+            for artist in artists:
+                # Finish mbA's URL lookup so it is resolved before sp050's batch
+                if artist["id"] == "sp040":
+                    for future in list(mb_client.futures):
+                        future.result()
+                yield artist
+
+        real_executor = checker.ThreadPoolExecutor
+
+        def executor(*args, **kwargs):
+            pool = real_executor(*args, **kwargs)
+            submit = pool.submit
+
+            def tracked_submit(*submit_args, **submit_kwargs):
+                future = submit(*submit_args, **submit_kwargs)
+                mb_client.futures.append(future)
+                return future
+
+            pool.submit = tracked_submit
+            return pool
+
+        mb_client.futures = []
+        with mock.patch.object(checker, "MB_SEARCH_BATCH_SIZE", 10), mock.patch.object(
+            checker, "ThreadPoolExecutor", executor
+        ), mock.patch("sys.stderr"):
+            results = {r["spotify_id"]: r for r in checker.iter_checked_artists(mb_client, playlist())}
+
+        self.assertEqual(len(results), len(artists))
+        for spotify_id in FakeMusicBrainzClient.LINKED_IDS:
+            self.assertTrue(results[spotify_id]["mb_found"])
+            self.assertEqual(
+                results[spotify_id]["flags"],
+                checker.SERVICE_BITS["spotify"] | checker.SERVICE_BITS["tidal"],
+            )
+        self.assertFalse(results["sp001"]["mb_found"])
+
+
+if __name__ == "__main__":
+    unittest.main()